@@ -14,8 +14,110 @@ Usage:
     # Returns translated keywords like "Prostate" or "Brain Tumor"
 """
 
+import functools
+import itertools
 import re
 
+# Matches versioned model IDs such as "prostate-v1.0.1"; group 1 is the base name
+_VERSION_RE = re.compile(r"^(.+)-v\d+\.\d+\.\d+$")
+
+# Title words long enough to be used as search keywords
+_WORD_RE = re.compile(r"\S{3,}")
+
+# Common title words that are not useful as search keywords
+_SKIP_WORDS = frozenset({"segmentation", "quick", "-", "ts1", "ts2", "v1", "v2", "the"})
+
+
+@functools.lru_cache(maxsize=1)
+def _get_monai_module():
+    """Import the MONAIAuto3DSeg module on first use and keep the handle."""
+    try:
+        import MONAIAuto3DSeg
+    except ImportError:
+        raise ImportError(
+            "MONAIAuto3DSeg extension is not installed or not available. "
+            "Please install the MONAIAuto3DSeg extension from the Extension Manager."
+        )
+    return MONAIAuto3DSeg
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_logic():
+    """
+    Return the shared MONAIAuto3DSegLogic instance used when no logic is passed.
+    
+    The logic is created once per process so the model catalog is only
+    loaded the first time it is needed.
+    """
+    return _get_monai_module().MONAIAuto3DSegLogic()
+
+
+def _version_key(model):
+    """Return the model version as a tuple of ints for sorting, e.g. (1, 0, 1)."""
+    try:
+        return tuple(int(part) for part in model["version"].split("."))
+    except (KeyError, AttributeError, ValueError):
+        return ()
+
+
+# Model lookup tables, keyed by id() of a logic's models list. The list itself
+# is kept alongside the tables so the id cannot be reused while cached.
+_modelIndexCache = {}
+
+
+def _get_model_tables(logic):
+    """
+    Return ({model id: model}, {base name: [models]}, {key: result}) for the given logic.
+    
+    The tables are built once per models list and reused on later calls.
+    Models in each base-name list are sorted by version, newest first. The
+    last dict memoizes query results for that models list.
+    """
+    models = logic.models
+    cached = _modelIndexCache.get(id(models))
+    if cached is None or cached[0] is not models:
+        modelsById = {}
+        modelsByBaseName = {}
+        for model in models:
+            modelsById[model["id"]] = model
+            match = _VERSION_RE.match(model["id"])
+            if match:
+                modelsByBaseName.setdefault(match.group(1), []).append(model)
+        for baseModels in modelsByBaseName.values():
+            baseModels.sort(key=_version_key, reverse=True)
+        cached = (models, modelsById, modelsByBaseName, {})
+        _modelIndexCache[id(models)] = cached
+    return cached[1:]
+
+
+def _get_model_index(logic):
+    """Return a cached {model id: model} dict for the models of the given logic."""
+    return _get_model_tables(logic)[0]
+
+
+def _get_models_by_base_name(logic):
+    """Return a cached {base name: [models]} dict for the models of the given logic."""
+    return _get_model_tables(logic)[1]
+
+
+def _get_query_cache(logic):
+    """Return the dict used to memoize query results for the models of the given logic."""
+    return _get_model_tables(logic)[2]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_translate():
+    """
+    Return Slicer's translate function, resolved once.
+    
+    Outside of Slicer, returns a pass-through that keeps the English text.
+    """
+    try:
+        from slicer.i18n import translate
+    except ImportError:
+        return lambda category, text: text
+    return translate
+
 
 def findModelId(preferredModelId, logic=None):
     """
@@ -26,7 +128,7 @@ def findModelId(preferredModelId, logic=None):
     
     Args:
         preferredModelId (str): The preferred model ID (e.g., "prostate-v1.0.1")
-        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, creates a new one.
+        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, uses a shared default.
     
     Returns:
         str: The model ID to use (exact match or latest version fallback)
@@ -48,39 +150,26 @@ def findModelId(preferredModelId, logic=None):
         ValueError: Model 'nonexistent-v1.0.0' not found and no fallback available
     """
     if logic is None:
-        try:
-            import MONAIAuto3DSeg
-            logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
-        except ImportError:
-            raise ImportError(
-                "MONAIAuto3DSeg extension is not installed or not available. "
-                "Please install the MONAIAuto3DSeg extension from the Extension Manager."
-            )
+        logic = _get_default_logic()
     
     # First, try to find exact match
-    for model in logic.models:
-        if model["id"] == preferredModelId:
-            print(f"✓ Model found: {preferredModelId}")
-            return preferredModelId
+    if preferredModelId in _get_model_index(logic):
+        print(f"✓ Model found: {preferredModelId}")
+        return preferredModelId
     
     # If exact match not found, extract base name and find latest version
     # Example: "prostate-v1.0.1" -> base: "prostate"
-    match = re.match(r"^(.+)-v\d+\.\d+\.\d+$", preferredModelId)
+    match = _VERSION_RE.match(preferredModelId)
     if match:
         baseName = match.group(1)
         print(f"⚠ Exact model '{preferredModelId}' not found.")
         print(f"  Searching for latest '{baseName}' version...")
         
-        # Find all models matching the base name
-        matchingModels = []
-        for model in logic.models:
-            if model["id"].startswith(baseName + "-v"):
-                if not model.get("deprecated", False):  # Skip deprecated models
-                    matchingModels.append(model)
+        # Candidates are sorted newest first, so take the first non-deprecated one
+        candidates = _get_models_by_base_name(logic).get(baseName, [])
+        latestModel = next((m for m in candidates if not m.get("deprecated", False)), None)
         
-        if matchingModels:
-            # Models are already sorted by version (first is latest non-deprecated)
-            latestModel = matchingModels[0]
+        if latestModel:
             print(f"✓ Using fallback model: {latestModel['id']}")
             print(f"  Title: {latestModel['title']}")
             print(f"  Version: {latestModel['version']}")
@@ -88,16 +177,15 @@ def findModelId(preferredModelId, logic=None):
     
     # If still not found, raise an error with helpful information
     availableIds = [m['id'] for m in logic.models if not m.get("deprecated", False)]
-    errorMsg = (
-        f"Model '{preferredModelId}' not found and no fallback available.\n"
-        f"Available models:\n"
-    )
-    for modelId in availableIds[:10]:  # Show first 10
-        errorMsg += f"  - {modelId}\n"
+    errorLines = [
+        f"Model '{preferredModelId}' not found and no fallback available.",
+        "Available models:",
+    ]
+    errorLines.extend(f"  - {modelId}" for modelId in availableIds[:10])  # Show first 10
     if len(availableIds) > 10:
-        errorMsg += f"  ... and {len(availableIds) - 10} more\n"
+        errorLines.append(f"  ... and {len(availableIds) - 10} more")
     
-    raise ValueError(errorMsg)
+    raise ValueError("\n".join(errorLines) + "\n")
 
 
 def getModelSearchKeywords(modelId, logic=None):
@@ -109,7 +197,7 @@ def getModelSearchKeywords(modelId, logic=None):
     
     Args:
         modelId (str): The model ID to get keywords for
-        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, creates a new one.
+        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, uses a shared default.
     
     Returns:
         str: 1-2 key words from the translated model title
@@ -126,43 +214,44 @@ def getModelSearchKeywords(modelId, logic=None):
     """
     if logic is None:
         try:
-            import MONAIAuto3DSeg
-            logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
+            logic = _get_default_logic()
         except ImportError:
             return ""
     
-    try:
-        import slicer
-        from slicer.i18n import translate
-    except ImportError:
-        # If not running in Slicer, just return English title words
-        translate = lambda category, text: text
-    
     # Find the model
-    for model in logic.models:
-        if model["id"] == modelId:
-            # Get translated title
-            translatedTitle = translate("Models", model["title"])
-            
-            # Extract meaningful keywords (skip common words)
-            skipWords = ["segmentation", "quick", "-", "ts1", "ts2", "v1", "v2", "the"]
-            words = translatedTitle.split()
-            keywords = []
-            
-            for word in words:
-                if word.lower() not in skipWords and len(word) > 2:
-                    keywords.append(word)
-                    if len(keywords) >= 2:  # Get first 2 meaningful words
-                        break
-            
-            # Return keywords
-            if keywords:
-                return " ".join(keywords)
-            else:
-                # Fallback to first word of title
-                return words[0] if words else ""
+    model = _get_model_index(logic).get(modelId)
+    if model is None:
+        return ""
     
-    return ""
+    return _get_title_keywords(model["title"])
+
+
+@functools.lru_cache(maxsize=256)
+def _get_title_keywords(title):
+    """
+    Return 1-2 search keywords from the translated form of a model title.
+    
+    Results are cached per title since titles and the application language
+    do not change during a session.
+    """
+    # If not running in Slicer, this just returns English title words
+    translate = _get_translate()
+    
+    # Get translated title
+    translatedTitle = translate("Models", title)
+    
+    # Extract the first 2 meaningful keywords (3+ characters, not a common word)
+    candidates = _WORD_RE.findall(translatedTitle)
+    keywords = list(itertools.islice(
+        (word for word in candidates if word.lower() not in _SKIP_WORDS), 2))
+    
+    # Return keywords
+    if keywords:
+        return " ".join(keywords)
+    else:
+        # Fallback to first word of title
+        words = translatedTitle.split(None, 1)
+        return words[0] if words else ""
 
 
 def listAvailableModels(logic=None, showDeprecated=False):
@@ -170,11 +259,13 @@ def listAvailableModels(logic=None, showDeprecated=False):
     List all available models with their details.
     
     Args:
-        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, creates a new one.
+        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, uses a shared default.
         showDeprecated (bool): Whether to show deprecated models. Default False.
     
     Returns:
         list: List of model dictionaries with id, title, version, etc.
+              Results are cached per logic; the dictionaries are shared
+              between calls and should not be modified.
     
     Example:
         >>> models = listAvailableModels()
@@ -182,23 +273,27 @@ def listAvailableModels(logic=None, showDeprecated=False):
         ...     print(f"{model['id']}: {model['title']}")
     """
     if logic is None:
-        import MONAIAuto3DSeg
-        logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
-    
-    models = []
-    for model in logic.models:
-        if not showDeprecated and model.get("deprecated", False):
-            continue
-        models.append({
-            'id': model['id'],
-            'title': model['title'],
-            'version': model['version'],
-            'description': model.get('description', ''),
-            'imagingModality': model.get('imagingModality', ''),
-            'deprecated': model.get('deprecated', False)
-        })
+        logic = _get_default_logic()
     
-    return models
+    queryCache = _get_query_cache(logic)
+    cacheKey = ("listAvailableModels", showDeprecated)
+    models = queryCache.get(cacheKey)
+    if models is None:
+        models = []
+        for model in logic.models:
+            if not showDeprecated and model.get("deprecated", False):
+                continue
+            models.append({
+                'id': model['id'],
+                'title': model['title'],
+                'version': model['version'],
+                'description': model.get('description', ''),
+                'imagingModality': model.get('imagingModality', ''),
+                'deprecated': model.get('deprecated', False)
+            })
+        queryCache[cacheKey] = models
+    
+    return list(models)
 
 
 def findModelsByBaseName(baseName, logic=None, includeDeprecated=False):
@@ -207,7 +302,7 @@ def findModelsByBaseName(baseName, logic=None, includeDeprecated=False):
     
     Args:
         baseName (str): Base name to search for (e.g., "prostate", "brats-gli")
-        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, creates a new one.
+        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, uses a shared default.
         includeDeprecated (bool): Whether to include deprecated versions. Default False.
     
     Returns:
@@ -218,16 +313,20 @@ def findModelsByBaseName(baseName, logic=None, includeDeprecated=False):
         ['prostate-v1.0.1', 'prostate-v1.0.0']
     """
     if logic is None:
-        import MONAIAuto3DSeg
-        logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
-    
-    matchingModels = []
-    for model in logic.models:
-        if model["id"].startswith(baseName + "-v"):
-            if includeDeprecated or not model.get("deprecated", False):
-                matchingModels.append(model["id"])
-    
-    return matchingModels
+        logic = _get_default_logic()
+    
+    queryCache = _get_query_cache(logic)
+    cacheKey = ("findModelsByBaseName", baseName, includeDeprecated)
+    modelIds = queryCache.get(cacheKey)
+    if modelIds is None:
+        modelIds = [
+            model["id"]
+            for model in _get_models_by_base_name(logic).get(baseName, [])
+            if includeDeprecated or not model.get("deprecated", False)
+        ]
+        queryCache[cacheKey] = modelIds
+    
+    return list(modelIds)
 
 
 def setModelById(modelId, logic=None, useTranslatedKeywords=True):
@@ -236,7 +335,7 @@ def setModelById(modelId, logic=None, useTranslatedKeywords=True):
     
     Args:
         modelId (str): The model ID to set (with fallback support via findModelId)
-        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, creates a new one.
+        logic (MONAIAuto3DSegLogic, optional): Logic instance. If None, uses a shared default.
         useTranslatedKeywords (bool): Whether to set search box with translated keywords. Default True.
     
     Returns:
@@ -250,8 +349,7 @@ def setModelById(modelId, logic=None, useTranslatedKeywords=True):
         'prostate-v1.0.1'  # search box will be empty
     """
     if logic is None:
-        import MONAIAuto3DSeg
-        logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
+        logic = _get_default_logic()
     
     # Use findModelId to support fallback
     actualModelId = findModelId(modelId, logic)
@@ -3,13 +3,106 @@
 
 import sys
 import os
-import json
+import functools
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import glob
 
+def _scan_subdirs(parent, predicate):
+    """Yield paths of subdirectories of parent whose name satisfies predicate"""
+    try:
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if predicate(entry.name) and entry.is_dir():
+                    yield entry.path
+    except OSError:
+        return
+
+def _find_tutorialmaker_via_scandir(root="/opt/slicer"):
+    """
+    Walk the known TutorialMaker install layouts under root with os.scandir
+    
+    Checks the same locations as the glob patterns in find_tutorialmaker_dir,
+    in the same order, and stops at the first match.
+    """
+    # <root>/slicer.org/Extensions-*/TutorialMaker/lib/Slicer-*/qt-scripted-modules
+    for extensions_dir in _scan_subdirs(os.path.join(root, "slicer.org"), lambda n: n.startswith("Extensions-")):
+        lib_dir = os.path.join(extensions_dir, "TutorialMaker", "lib")
+        for slicer_dir in _scan_subdirs(lib_dir, lambda n: n.startswith("Slicer-")):
+            for match in _scan_subdirs(slicer_dir, lambda n: n == "qt-scripted-modules"):
+                return Path(match)
+    
+    slicer_dirs = list(_scan_subdirs(os.path.join(root, "lib"), lambda n: n.startswith("Slicer-")))
+    
+    # <root>/lib/Slicer-*/qt-scripted-modules/TutorialMaker
+    for slicer_dir in slicer_dirs:
+        modules_dir = os.path.join(slicer_dir, "qt-scripted-modules")
+        for match in _scan_subdirs(modules_dir, lambda n: n == "TutorialMaker"):
+            return Path(match)
+    
+    # <root>/lib/Slicer-*/extensions-*/TutorialMaker*
+    for slicer_dir in slicer_dirs:
+        for extensions_dir in _scan_subdirs(slicer_dir, lambda n: n.startswith("extensions-")):
+            for match in _scan_subdirs(extensions_dir, lambda n: n.startswith("TutorialMaker")):
+                return Path(match)
+    
+    return None
+
+# Files below this size are copied with a single read and write
+_TINY_FILE_SIZE = 64 * 1024
+
+def _tiny_copy(src, dst):
+    """Copy a small file in one read and one write"""
+    with open(src, 'rb') as fsrc:
+        data = fsrc.read()
+    with open(dst, 'wb') as fdst:
+        fdst.write(data)
+
+def _fast_copy(src, dst):
+    """
+    Copy file contents from src to dst without copying metadata
+    
+    Small files (most translation JSONs) are copied in one read/write pair.
+    Larger files use os.copy_file_range where available so the data stays in
+    the kernel, and fall back to shutil.copyfile otherwise.
+    """
+    if os.stat(src).st_size < _TINY_FILE_SIZE:
+        _tiny_copy(src, dst)
+        return
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+def _needs_copy(src, dst):
+    """
+    Check whether dst is missing or older than src
+    
+    A destination with the same size and an mtime at least as recent as the
+    source is treated as up to date, which makes CI re-runs skip the write.
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    return not (src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns <= dst_stat.st_mtime_ns)
+
+@functools.lru_cache(maxsize=1)
 def find_tutorialmaker_dir():
-    """Find TutorialMaker extension directory"""
+    """Find TutorialMaker extension directory (searched once per process)"""
     
     patterns = [
         "/opt/slicer/slicer.org/Extensions-*/TutorialMaker/lib/Slicer-*/qt-scripted-modules",
@@ -17,6 +110,12 @@ def find_tutorialmaker_dir():
         "/opt/slicer/lib/Slicer-*/extensions-*/TutorialMaker*",
     ]
     
+    path = _find_tutorialmaker_via_scandir()
+    if path:
+        print(f"✅ Found TutorialMaker at: {path}")
+        return path
+    
+    # Fall back to glob in case a layout is not covered by the scandir walk
     for pattern in patterns:
         matches = glob.glob(pattern)
         if matches:
@@ -30,7 +129,7 @@ def find_tutorialmaker_dir():
         print(f"  - {pattern}")
     sys.exit(1)
 
-def setup_tutorial_files(tutorial_name, tutorial_dir, languages):
+def setup_tutorial_files(tutorial_name, tutorial_dir, languages, quiet=False):
     """
     Setup tutorial files in TutorialMaker directory
     
@@ -38,14 +137,24 @@ def setup_tutorial_files(tutorial_name, tutorial_dir, languages):
         tutorial_name: Full tutorial name (e.g., STC-GEN-101_WelcomeTutorial)
         tutorial_dir: Path to tutorial directory in repository
         languages: List of language codes
+        quiet: Print a single summary line instead of per-file progress
     """
-    print(f"\n=== Setting up files for: {tutorial_name} ===")
+    # Progress messages are collected and written to stdout in one go
+    messages = []
+    log = messages.append
+    
+    def flush_messages():
+        if messages and not quiet:
+            sys.stdout.write("\n".join(messages) + "\n")
+        messages.clear()
+    
+    log(f"\n=== Setting up files for: {tutorial_name} ===")
     
     tutorialmaker_dir = find_tutorialmaker_dir()
     
     # Create annotations directory for THIS specific tutorial
     tutorial_name_only = tutorial_name.split('_', 1)[1] if '_' in tutorial_name else tutorial_name
-    print(f"Tutorial name (without ID): {tutorial_name_only}")
+    log(f"Tutorial name (without ID): {tutorial_name_only}")
     
     annotations_dir = tutorialmaker_dir / "Outputs" / "Annotations" / tutorial_name_only
     annotations_dir.mkdir(parents=True, exist_ok=True)
@@ -57,62 +166,99 @@ def setup_tutorial_files(tutorial_name, tutorial_dir, languages):
     tutorial_py = Path(tutorial_dir) / f"{tutorial_name_only}.py"
     if tutorial_py.exists():
         target_py = testing_dir / f"{tutorial_name_only}.py"
-        print(f"✅ Copying {tutorial_py.name} -> {target_py}")
-        shutil.copy2(tutorial_py, target_py)
+        log(f"✅ Copying {tutorial_py.name} -> {target_py}")
+        _fast_copy(tutorial_py, target_py)
     else:
+        flush_messages()
         print(f"❌ ERROR: Tutorial Python file not found: {tutorial_py}")
         sys.exit(1)
     
     # Copy tutorial JSON file
     translations_dir = Path(tutorial_dir) / "Translations"
     
+    # Plain string paths avoid Path overhead in the per-file steps below
+    translations_dir_str = os.fspath(translations_dir)
+    annotations_dir_str = os.fspath(annotations_dir)
+    
+    # List the translations directory once and check names against it
+    try:
+        translation_names = set(os.listdir(translations_dir))
+    except OSError:
+        translation_names = set()
+    
     json_candidates = [
-        translations_dir / f"{tutorial_name}.json",
-        translations_dir / f"{tutorial_name_only}.json",
+        f"{tutorial_name}.json",
+        f"{tutorial_name_only}.json",
     ]
     
-    annotations_json = annotations_dir / "annotations.json"
+    annotations_json = os.path.join(annotations_dir_str, "annotations.json")
     copied = False
     
-    for candidate in json_candidates:
-        if candidate.exists():
-            print(f"✅ Copying {candidate.name} -> annotations.json")
-            shutil.copy2(candidate, annotations_json)
+    for candidate_name in json_candidates:
+        if candidate_name in translation_names:
+            candidate = os.path.join(translations_dir_str, candidate_name)
+            if _needs_copy(candidate, annotations_json):
+                log(f"✅ Copying {candidate_name} -> annotations.json")
+                _fast_copy(candidate, annotations_json)
+            else:
+                log(f"✅ annotations.json is up to date")
             copied = True
             break
     
     if not copied:
-        print(f"⚠️  Warning: Tutorial JSON not found")
+        log(f"⚠️  Warning: Tutorial JSON not found")
     
     # Copy default text_dict (base translation)
-    default_dict = translations_dir / "text_dict_default.json"
-    if default_dict.exists():
-        target_default = annotations_dir / "text_dict_default.json"
-        print(f"✅ Copying text_dict_default.json")
-        shutil.copy2(default_dict, target_default)
+    if "text_dict_default.json" in translation_names:
+        default_dict = os.path.join(translations_dir_str, "text_dict_default.json")
+        target_default = os.path.join(annotations_dir_str, "text_dict_default.json")
+        if _needs_copy(default_dict, target_default):
+            log(f"✅ Copying text_dict_default.json")
+            _fast_copy(default_dict, target_default)
+        else:
+            log(f"✅ text_dict_default.json is up to date")
     
     # Copy translation files
-    for language in languages:
-        lang_file = translations_dir / f"text_dict_{language}.json"
-        target_file = annotations_dir / f"text_dict_{language}.json"
+    def copy_language(language):
+        lang_name = f"text_dict_{language}.json"
+        lang_file = os.path.join(translations_dir_str, lang_name)
+        target_file = os.path.join(annotations_dir_str, lang_name)
         
-        if lang_file.exists():
-            print(f"✅ Copying text_dict_{language}.json")
-            shutil.copy2(lang_file, target_file)
+        if lang_name in translation_names:
+            if not _needs_copy(lang_file, target_file):
+                return f"✅ text_dict_{language}.json is up to date"
+            _fast_copy(lang_file, target_file)
+            return f"✅ Copying text_dict_{language}.json"
         else:
-            print(f"⚠️  Warning: Translation not found for {language}")
-            with open(target_file, 'w', encoding='utf-8') as f:
-                json.dump({}, f)
+            with open(target_file, 'wb') as f:
+                f.write(b"{}")
+            return f"⚠️  Warning: Translation not found for {language}"
+    
+    # Languages are independent, so copy them concurrently and report in order
+    if languages:
+        with ThreadPoolExecutor(max_workers=min(8, len(languages))) as executor:
+            for message in executor.map(copy_language, languages):
+                log(message)
     
-    print(f"\n✅ Setup completed for: {tutorial_name_only}")
-    print(f"   Annotations directory: {annotations_dir}")
-    print(f"   JSON files: {len(list(annotations_dir.glob('*.json')))}")
-    print(f"   Python files in Testing: {len(list(testing_dir.glob('*.py')))}")
+    # List the annotations directory once; DirEntry caches the stat result
+    with os.scandir(annotations_dir) as entries:
+        json_entries = sorted((e for e in entries if e.name.endswith('.json')), key=lambda e: e.name)
+    
+    if quiet:
+        print(f"✅ Setup completed for: {tutorial_name_only} ({len(json_entries)} JSON files)")
+        return
+    
+    log(f"\n✅ Setup completed for: {tutorial_name_only}")
+    log(f"   Annotations directory: {annotations_dir}")
+    log(f"   JSON files: {len(json_entries)}")
+    log(f"   Python files in Testing: {len(list(testing_dir.glob('*.py')))}")
     
     # List all copied files for verification
-    print(f"\nCopied files:")
-    for json_file in sorted(annotations_dir.glob('*.json')):
-        print(f"   - {json_file.name}")
+    log(f"\nCopied files:")
+    for json_entry in json_entries:
+        log(f"   - {json_entry.name} ({json_entry.stat().st_size} bytes)")
+    
+    flush_messages()
 
 def main():
     import argparse
@@ -121,13 +267,15 @@ def main():
     parser.add_argument('tutorial_name', help='Tutorial name (e.g., STC-GEN-101_WelcomeTutorial)')
     parser.add_argument('tutorial_dir', help='Path to tutorial directory')
     parser.add_argument('--languages', nargs='+', required=True, help='Language codes')
+    parser.add_argument('--quiet', action='store_true', help='Only print a summary line per tutorial')
     
     args = parser.parse_args()
     
     setup_tutorial_files(
         tutorial_name=args.tutorial_name,
         tutorial_dir=args.tutorial_dir,
-        languages=args.languages
+        languages=args.languages,
+        quiet=args.quiet
     )
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+import re
+import time
+
 import ctk
 import qt
 
@@ -7,6 +10,12 @@ from slicer.ScriptedLoadableModule import *
 from Lib.TutorialUtils import Util
 from slicer.i18n import translate
 
+# Versioned MONAIAuto3DSeg model ID, e.g. "prostate-v1.0.1" (group 1 is the base name)
+_MODEL_ID_RE = re.compile(r"^(.+?)-v\d+\.\d+\.\d+$")
+
+# Common title words that are skipped when building model search keywords
+_SKIP_WORDS = frozenset({"segmentation", "quick", "-", "ts1", "ts2", "v1", "v2"})
+
 # Slicer4Minute
 
 class Slicer4MinuteTest(ScriptedLoadableModuleTest):
@@ -16,6 +25,52 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
     https://github.com/Slicer/Slicer/blob/main/Base/Python/slicer/ScriptedLoadableModule.py
     """
 
+    # Lowercase names of the segments that mark each model run as finished
+    _PROSTATE_TARGETS = frozenset(("prostate pz", "prostate tz"))
+    _BRAIN_TARGETS = frozenset(("necrosis",))
+    _WHOLEBODY_TARGETS = frozenset(("urinary bladder",))
+
+    # Set to True to print routine progress messages (fallbacks and errors are always printed)
+    _verbose = False
+
+    # MONAIAuto3DSegLogic shared by all sections and test runs (created on first use)
+    _logicCache = None
+
+    # Model lookup tables for _indexedLogic: {model id: model} and {base name: [models]}
+    _indexedLogic = None
+    _modelById = {}
+    _modelsByBase = {}
+
+    def _getLogic(self):
+        """
+        Return the shared MONAIAuto3DSegLogic instance, creating it on first use.
+        Importing MONAIAuto3DSeg and building its logic is expensive, so it is done once.
+        """
+        if self.__class__._logicCache is None:
+            import MONAIAuto3DSeg
+            self.__class__._logicCache = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
+            self._indexModels(self.__class__._logicCache)
+        return self.__class__._logicCache
+
+    def _indexModels(self, logic):
+        """
+        Build the model lookup tables for the given logic, unless they are already built.
+        Models in each base-name list keep their catalog order (first is latest).
+        """
+        cls = self.__class__
+        if cls._indexedLogic is logic:
+            return
+        modelById = {}
+        modelsByBase = {}
+        for model in logic.models:
+            modelById[model["id"]] = model
+            match = _MODEL_ID_RE.match(model["id"])
+            if match:
+                modelsByBase.setdefault(match.group(1), []).append(model)
+        cls._modelById = modelById
+        cls._modelsByBase = modelsByBase
+        cls._indexedLogic = logic
+
     def findModelId(self, preferredModelId, logic=None):
         """
         Find a model ID with fallback support.
@@ -23,7 +78,7 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         
         Args:
             preferredModelId (str): The preferred model ID (e.g., "prostate-v1.0.1")
-            logic: MONAIAuto3DSegLogic instance (optional, will create if not provided)
+            logic: MONAIAuto3DSegLogic instance (optional, uses the shared instance if not provided)
         
         Returns:
             str: The model ID to use (exact match or latest version fallback)
@@ -34,28 +89,24 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
             "prostate-v1.0.2"  # if v1.0.1 doesn't exist but v1.0.2 does
         """
         if logic is None:
-            import MONAIAuto3DSeg
-            logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
+            logic = self._getLogic()
+        self._indexModels(logic)
         
         # First, try to find exact match
-        for model in logic.models:
-            if model["id"] == preferredModelId:
+        if preferredModelId in self._modelById:
+            if self._verbose:
                 print(f"Model found: {preferredModelId}")
-                return preferredModelId
+            return preferredModelId
         
         # If exact match not found, extract base name and find latest version
         # Example: "prostate-v1.0.1" -> base: "prostate"
-        import re
-        match = re.match(r"^(.+)-v\d+\.\d+\.\d+$", preferredModelId)
+        match = _MODEL_ID_RE.match(preferredModelId)
         if match:
             baseName = match.group(1)
             print(f"Exact model '{preferredModelId}' not found. Searching for latest '{baseName}' version...")
             
             # Find all models matching the base name
-            matchingModels = []
-            for model in logic.models:
-                if model["id"].startswith(baseName + "-v"):
-                    matchingModels.append(model)
+            matchingModels = self._modelsByBase.get(baseName)
             
             if matchingModels:
                 # Sort by version (models are already sorted by version, first is latest)
@@ -73,7 +124,7 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         
         Args:
             modelId (str): The model ID to get keywords for
-            logic: MONAIAuto3DSegLogic instance (optional, will create if not provided)
+            logic: MONAIAuto3DSegLogic instance (optional, uses the shared instance if not provided)
         
         Returns:
             str: 1-2 key words from the translated model title
@@ -84,42 +135,120 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
             >>> self.getModelSearchKeywords("brats-gli-v1.0.0")
             "Brain Tumor" or "BRATS GLI"
         """
-        if logic is None:
-            import MONAIAuto3DSeg
-            logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
+        if modelId in self._kwCache:
+            return self._kwCache[modelId]
         
-        from slicer.i18n import translate
+        if logic is None:
+            logic = self._getLogic()
+        self._indexModels(logic)
         
         # Find the model
-        for model in logic.models:
-            if model["id"] == modelId:
-                # Get translated title
-                translatedTitle = translate("Models", model["title"])
-                
-                # Extract meaningful keywords (skip common words like "segmentation", "quick", etc.)
-                skipWords = ["segmentation", "quick", "-", "ts1", "ts2", "v1", "v2"]
-                words = translatedTitle.split()
-                keywords = []
-                
-                for word in words:
-                    if word.lower() not in skipWords and len(word) > 2:
-                        keywords.append(word)
-                        if len(keywords) >= 2:  # Get first 2 meaningful words
-                            break
-                
-                # Return keywords
-                if keywords:
-                    return " ".join(keywords)
-                else:
-                    # Fallback to first word of title
-                    return words[0] if words else ""
+        model = self._modelById.get(modelId)
+        if model is None:
+            return ""
+        
+        # Get translated title
+        translatedTitle = translate("Models", model["title"])
+        
+        # Extract meaningful keywords (skip common words like "segmentation", "quick", etc.)
+        # The cheap length check runs first so short words are never lowercased
+        words = translatedTitle.split()
+        keywords = []
+        
+        for word in words:
+            if len(word) > 2 and word.lower() not in _SKIP_WORDS:
+                keywords.append(word)
+                if len(keywords) == 2:  # Get first 2 meaningful words
+                    break
         
-        return ""
+        # Return keywords
+        if keywords:
+            searchKeywords = " ".join(keywords)
+        else:
+            # Fallback to first word of title
+            searchKeywords = words[0] if words else ""
+        self._kwCache[modelId] = searchKeywords
+        return searchKeywords
+
+    def _findWidget(self, name):
+        """
+        Return the main window child widget with the given object name.
+        Widgets are looked up once and cached, as findChild walks the whole widget tree.
+        """
+        widget = self._widgetCache.get(name)
+        if widget is None:
+            widget = slicer.util.findChild(slicer.util.mainWindow(), name)
+            self._widgetCache[name] = widget
+        return widget
+
+    def _waitForSegment(self, targetNames, timeout=300):
+        """
+        Wait until a segmentation node contains segments with all the given names.
+        Instead of polling, the scene and segmentations are observed so the wait ends as soon
+        as the segments appear. Returns False if the timeout (in seconds) expires first.
+        """
+        # Lowercase the targets once; segment names are compared in lowercase
+        targets = frozenset(name.lower() for name in targetNames)
+        loop = qt.QEventLoop()
+        observations = {}  # segmentation node ID -> (segmentation, [observer tags])
+        found = False
+
+        def segmentsFound():
+            try:
+                for seg_node in slicer.util.getNodesByClass('vtkMRMLSegmentationNode'):
+                    segmentation = seg_node.GetSegmentation()
+                    segment_names = {segmentation.GetSegment(segmentID).GetName().lower() for segmentID in segmentation.GetSegmentIDs()}
+                    if targets.issubset(segment_names):
+                        return True
+            except Exception as e:
+                print(f"Error checking segments: {e}")
+            return False
+
+        def onSegmentsChanged(caller=None, event=None):
+            nonlocal found
+            if not found and segmentsFound():
+                found = True
+                loop.quit()
+
+        def onNodeAdded(caller=None, event=None):
+            # Observe segment changes of any segmentation node that is not observed yet
+            for seg_node in slicer.util.getNodesByClass('vtkMRMLSegmentationNode'):
+                if seg_node.GetID() in observations:
+                    continue
+                segmentation = seg_node.GetSegmentation()
+                tags = [segmentation.AddObserver(eventId, onSegmentsChanged)
+                        for eventId in (slicer.vtkSegmentation.SegmentAdded, slicer.vtkSegmentation.SegmentModified)]
+                observations[seg_node.GetID()] = (segmentation, tags)
+            onSegmentsChanged()
+
+        sceneTag = slicer.mrmlScene.AddObserver(slicer.vtkMRMLScene.NodeAddedEvent, onNodeAdded)
+        timer = qt.QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+        try:
+            onNodeAdded()
+            if not found:
+                timer.start(timeout * 1000)
+                loop.exec_()
+        finally:
+            timer.stop()
+            slicer.mrmlScene.RemoveObserver(sceneTag)
+            for segmentation, tags in observations.values():
+                for tag in tags:
+                    segmentation.RemoveObserver(tag)
+
+        if not found:
+            print(f"Timed out after {timeout} s waiting for segments: {sorted(targets)}")
+        return found
 
     def setUp(self):
         """ Do whatever is needed to reset the state - typically a scene clear will be enough.
         """
         slicer.mrmlScene.Clear(0)
+        # Search keywords already computed for each model ID
+        self._kwCache = {}
+        # Widgets already found by object name
+        self._widgetCache = {}
 
     def runTest(self):
         """Run as few or as many tests as needed here.
@@ -133,6 +262,9 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         
         layoutManager = slicer.app.layoutManager()
         mainWindow = slicer.util.mainWindow()  
+        # Module selector combo box and its popup menu; they do not change during the test
+        combo = mainWindow.moduleSelector().findChildren(qt.QComboBox)[0]
+        modMenu = combo.parent().children()[4]
         
         self.delayDisplay("Starting the test")
         import os
@@ -146,18 +278,20 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         # TUTORIALMAKER BEGIN
                 
         # Pre-install PyTorch without user confirmation
-        try:
-            import PyTorchUtils
-            torchLogic = PyTorchUtils.PyTorchUtilsLogic()
-            if not torchLogic.torchInstalled():
-                self.delayDisplay("Installing PyTorch... (may take a few minutes)")
-                torchLogic.installTorch(askConfirmation=False, torchVersionRequirement=">=1.12")
-        except Exception as e:
-            print(f"Error installing PyTorch: {e}")
+        # (PyTorchUtils is only needed when torch cannot be found at all)
+        import importlib.util
+        if importlib.util.find_spec("torch") is None:
+            try:
+                import PyTorchUtils
+                torchLogic = PyTorchUtils.PyTorchUtilsLogic()
+                if not torchLogic.torchInstalled():
+                    self.delayDisplay("Installing PyTorch... (may take a few minutes)")
+                    torchLogic.installTorch(askConfirmation=False, torchVersionRequirement=">=1.12")
+            except Exception as e:
+                print(f"Error installing PyTorch: {e}")
         
         # Now install MONAI and check dependencies
-        import MONAIAuto3DSeg
-        logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
+        logic = self._getLogic()
         logic.setupPythonRequirements(upgrade=False)
         self.delayDisplay("Dependencies installed successfully!")
 
@@ -167,7 +301,7 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         # Close Data Probe if it's open
         try:
             # Find and close the Data Probe widget
-            dataProbe = slicer.util.findChild(slicer.util.mainWindow(), 'DataProbeCollapsibleWidget')
+            dataProbe = self._findWidget("DataProbeCollapsibleWidget")
             if dataProbe and dataProbe.collapsed == False:
                 dataProbe.collapsed = True
         except:
@@ -195,30 +329,34 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         #ww.close()
 
         # 3 shot: Load protate data
-        import urllib.request
         import zipfile
+        import SampleData
 
         # Caminho para salvar o ZIP e extrair
         zip_url = "https://www.dropbox.com/scl/fi/6wblo2a3gmxngbd0h4ums/SlicerData.zip?rlkey=bkp7g1pofcyd2zo7v3erihsl0&st=kxwp96l9&dl=1"
-        zip_path = os.path.join(slicer.app.temporaryPath, "SlicerData.zip")
         extract_path = os.path.join(slicer.app.temporaryPath, "SlicerData")
-
-        # Baixar ZIP se não existir
-        if not os.path.exists(zip_path):
-            urllib.request.urlretrieve(zip_url, zip_path)
+        extracted_marker = os.path.join(extract_path, ".extracted")
+
+        # Baixar e extrair o ZIP se não estiver extraído (the marker is written once extraction completes)
+        if not os.path.exists(extracted_marker):
+            # SampleData keeps the ZIP in the Slicer download cache, so it is only downloaded once
+            sampleDataLogic = SampleData.SampleDataLogic()
+            zip_path = sampleDataLogic.downloadFileIntoCache(zip_url, "SlicerData.zip")
+            if not zipfile.is_zipfile(zip_path):
+                # A previous download was interrupted, fetch it again
+                os.remove(zip_path)
+                zip_path = sampleDataLogic.downloadFileIntoCache(zip_url, "SlicerData.zip")
+            if not zipfile.is_zipfile(zip_path):
+                raise Exception(f"Downloaded file is not a valid ZIP archive: {zip_path}")
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(slicer.app.temporaryPath)
+            open(extracted_marker, 'w').close()
 
         # Carregar os volumes
         prostate_folder = os.path.join(extract_path, "dataset3_ProstateMRI")
         adc_path = os.path.join(prostate_folder, "msd-prostate-01-adc.nrrd")
         t2_path = os.path.join(prostate_folder, "msd-prostate-01-t2.nrrd")
 
-        # Extrair ZIP se não estiver extraído
-        if not (os.path.exists(adc_path) and os.path.exists(t2_path)):
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(slicer.app.temporaryPath)
-
-        
-
         slicer.util.loadVolume(adc_path)
         slicer.util.loadVolume(t2_path)
 
@@ -226,15 +364,13 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         self.delayDisplay('Screenshot #3: Load protate data')
 
         # 4 shot: Open module selector and select Segmentation
-        combo = mainWindow.moduleSelector().findChildren(qt.QComboBox)[0]
-        modMenu = combo.parent().children()[4]
         combo.showPopup()
-        for mActions in modMenu.actions():
-            if mActions.text == translate("qSlicerAbstractCoreModule","Segmentation") or mActions.text == "Segmentation":
-                segAction = mActions
-                modMenu.setActiveAction(segAction)
-                mainWindow.moduleSelector().selectModule('MONAIAuto3DSeg')
-                break
+        # Highlight the Segmentation entry in the open menu for the screenshot
+        segmentationLabels = {translate("qSlicerAbstractCoreModule", "Segmentation"), "Segmentation"}
+        segAction = next((action for action in modMenu.actions() if action.text in segmentationLabels), None)
+        if segAction:
+            modMenu.setActiveAction(segAction)
+        mainWindow.moduleSelector().selectModule('MONAIAuto3DSeg')
         # TUTORIALMAKER SCREENSHOT
         self.delayDisplay('Screenshot #4: Auto3DSeg module selected')
         
@@ -242,31 +378,32 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         modMenu.close()
         
         # Use model ID instead of translated title for language-independent selection
-        import MONAIAuto3DSeg
-        logic = MONAIAuto3DSeg.MONAIAuto3DSegLogic()
-        
         # Set the model directly by ID with fallback support
         modelId = self.findModelId("prostate-v1.0.1", logic)
+        # The brain and whole-body sections reuse this logic and parameter node
         parameterNode = logic.getParameterNode()
         parameterNode.SetParameter("Model", modelId)
         
         # Set search box with translated keywords for visual feedback
-        searchBox = slicer.util.findChild(slicer.util.mainWindow(), "modelSearchBox")
+        searchBox = self._findWidget("modelSearchBox")
         searchKeywords = self.getModelSearchKeywords(modelId, logic)
         searchBox.setText(searchKeywords)
 
         # TUTORIALMAKER SCREENSHOT
         self.delayDisplay('Screenshot #6: Prostate model selected')
 
+        # This second capture of the same state is a separate slide (annotated with the
+        # input volume instructions in Translations), so removing it would shift the
+        # annotations of every following slide.
         # TUTORIALMAKER SCREENSHOT
         self.delayDisplay('Screenshot #6: Prostate model selected and ready to run')
 
         # 7 shot: Start model and take screenshot
-        nodeSelectorT2= slicer.util.findChild(slicer.util.mainWindow(), "inputNodeSelector0")
+        nodeSelectorT2= self._findWidget("inputNodeSelector0")
         nodeT2 = slicer.util.getNode("msd-prostate-01-t2")
         nodeSelectorT2.setCurrentNode(nodeT2)
 
-        nodeSelectorAdc = slicer.util.findChild(slicer.util.mainWindow(), "inputNodeSelector1")
+        nodeSelectorAdc = self._findWidget("inputNodeSelector1")
         nodeAdc = slicer.util.getNode("msd-prostate-01-adc")
         nodeSelectorAdc.setCurrentNode(nodeAdc)
 
@@ -274,39 +411,13 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         self.delayDisplay('Screenshot #7: T2 input node selected')
 
         # 8 shot: Run model
-        runButton = slicer.util.findChild(slicer.util.mainWindow(), "applyButton")
+        runButton = self._findWidget("applyButton")
         runButton.click()
         # TUTORIALMAKER SCREENSHOT
         self.delayDisplay('Screenshot #8: Model running')
         self.delayDisplay('Waiting for the model to finish...')
         
-        import time
-        segment_found = False
-        max_wait_time = 300  # Maximum wait time in seconds (5 minutes)
-        start_time = time.time()
-        
-        while not segment_found:
-            # Process GUI events to prevent freezing
-            slicer.app.processEvents()
-            
-            # Check for timeout
-            if time.time() - start_time > max_wait_time:
-                break
-            
-            try:
-                segmentation_nodes = slicer.util.getNodesByClass('vtkMRMLSegmentationNode')
-                for seg_node in segmentation_nodes:
-                    if seg_node.GetSegmentation().GetNumberOfSegments() > 0:
-                        segment_names = [seg_node.GetSegmentation().GetNthSegment(i).GetName().lower() for i in range(seg_node.GetSegmentation().GetNumberOfSegments())]
-                        if "prostate pz" in segment_names and "prostate tz" in segment_names:
-                            segment_found = True
-                            break
-            except Exception as e:
-                print(f"Error checking segments: {e}")
-                pass
-            
-            # Small delay to prevent excessive CPU usage
-            time.sleep(1)
+        self._waitForSegment(self._PROSTATE_TARGETS)
 
         # 9 shot: Result
         # TUTORIALMAKER SCREENSHOT
@@ -314,8 +425,12 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
 
         ### BRAIN GLIOMA ###
         segmentation_nodes = slicer.util.getNodesByClass('vtkMRMLSegmentationNode')
-        for seg_node in segmentation_nodes:
-            slicer.mrmlScene.RemoveNode(seg_node)
+        slicer.mrmlScene.StartState(slicer.vtkMRMLScene.BatchProcessState)
+        try:
+            for seg_node in segmentation_nodes:
+                slicer.mrmlScene.RemoveNode(seg_node)
+        finally:
+            slicer.mrmlScene.EndState(slicer.vtkMRMLScene.BatchProcessState)
 
         # 1 shot: 
         # mainWindow.moduleSelector().selectModule('Welcome')
@@ -334,10 +449,13 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         braTS_t2f_path = os.path.join(brain_glioma_folder, "BraTS-GLI-00006-000-t2f.nii.gz")
         braTS_t2w_path = os.path.join(brain_glioma_folder, "BraTS-GLI-00006-000-t2w.nii.gz")
 
-        slicer.util.loadVolume(braTS_t1c_path)
-        slicer.util.loadVolume(braTS_t1n_path)
-        slicer.util.loadVolume(braTS_t2f_path)
-        slicer.util.loadVolume(braTS_t2w_path)
+        # Load the four inputs in one scene batch so views and module GUIs update once
+        slicer.mrmlScene.StartState(slicer.vtkMRMLScene.BatchProcessState)
+        try:
+            for braTS_path in (braTS_t1c_path, braTS_t1n_path, braTS_t2f_path, braTS_t2w_path):
+                slicer.util.loadVolume(braTS_path)
+        finally:
+            slicer.mrmlScene.EndState(slicer.vtkMRMLScene.BatchProcessState)
 
         # TUTORIALMAKER SCREENSHOT
         self.delayDisplay('Screenshot #2: Load protate data')
@@ -350,7 +468,7 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         parameterNode.SetParameter("Model", modelId)
         
         # Set search box with translated keywords for visual feedback
-        searchBox = slicer.util.findChild(slicer.util.mainWindow(), "modelSearchBox")
+        searchBox = self._findWidget("modelSearchBox")
         searchKeywords = self.getModelSearchKeywords(modelId, logic)
         searchBox.setText(searchKeywords)
 
@@ -358,19 +476,19 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         self.delayDisplay('Screenshot #3: Brain Tumor Segmentation (BRATS) GLI model selected and ready to run')
 
         # 4 shot: Select volume inputs
-        nodeSelectorT2F= slicer.util.findChild(slicer.util.mainWindow(), "inputNodeSelector0")
+        nodeSelectorT2F= self._findWidget("inputNodeSelector0")
         nodeT2F = slicer.util.getNode("BraTS-GLI-00006-000-t2f")
         nodeSelectorT2F.setCurrentNode(nodeT2F)
         
-        nodeSelectorT1C= slicer.util.findChild(slicer.util.mainWindow(), "inputNodeSelector1")
+        nodeSelectorT1C= self._findWidget("inputNodeSelector1")
         nodeT1C = slicer.util.getNode("BraTS-GLI-00006-000-t1c")
         nodeSelectorT1C.setCurrentNode(nodeT1C)
         
-        nodeSelectorT1N= slicer.util.findChild(slicer.util.mainWindow(), "inputNodeSelector2")
+        nodeSelectorT1N= self._findWidget("inputNodeSelector2")
         nodeT1N = slicer.util.getNode("BraTS-GLI-00006-000-t1n")
         nodeSelectorT1N.setCurrentNode(nodeT1N)
         
-        nodeSelectorT2W= slicer.util.findChild(slicer.util.mainWindow(), "inputNodeSelector3")
+        nodeSelectorT2W= self._findWidget("inputNodeSelector3")
         nodeT2W = slicer.util.getNode("BraTS-GLI-00006-000-t2w")
         nodeSelectorT2W.setCurrentNode(nodeT2W)
 
@@ -378,39 +496,13 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         self.delayDisplay('Screenshot #4: Brain Tumor Segmentation (BRATS) GLI input node selected')       
 
         # 5 shot: Run model
-        runButton = slicer.util.findChild(slicer.util.mainWindow(), "applyButton")
+        runButton = self._findWidget("applyButton")
         runButton.click()
         # TUTORIALMAKER SCREENSHOT
         self.delayDisplay('Screenshot #5: Model running')
         self.delayDisplay('Waiting for the model to finish...')
         
-        import time
-        segment_found = False
-        max_wait_time = 300  # Maximum wait time in seconds (5 minutes)
-        start_time = time.time()
-        
-        while not segment_found:
-            # Process GUI events to prevent freezing
-            slicer.app.processEvents()
-            
-            # Check for timeout
-            if time.time() - start_time > max_wait_time:
-                break
-            
-            try:
-                segmentation_nodes = slicer.util.getNodesByClass('vtkMRMLSegmentationNode')
-                for seg_node in segmentation_nodes:
-                    if seg_node.GetSegmentation().GetNumberOfSegments() > 0:
-                        segment_names = [seg_node.GetSegmentation().GetNthSegment(i).GetName().lower() for i in range(seg_node.GetSegmentation().GetNumberOfSegments())]
-                        if "necrosis" in segment_names:
-                            segment_found = True
-                            break
-            except Exception as e:
-                print(f"Error checking segments: {e}")
-                pass
-            
-            # Small delay to prevent excessive CPU usage
-            time.sleep(1)
+        self._waitForSegment(self._BRAIN_TARGETS)
 
         # 9 shot: Result
         # TUTORIALMAKER SCREENSHOT
@@ -418,14 +510,17 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
 
         ### WHOLE BODY ###
         segmentation_nodes = slicer.util.getNodesByClass('vtkMRMLSegmentationNode')
-        for seg_node in segmentation_nodes:
-            slicer.mrmlScene.RemoveNode(seg_node)
+        slicer.mrmlScene.StartState(slicer.vtkMRMLScene.BatchProcessState)
+        try:
+            for seg_node in segmentation_nodes:
+                slicer.mrmlScene.RemoveNode(seg_node)
+        finally:
+            slicer.mrmlScene.EndState(slicer.vtkMRMLScene.BatchProcessState)
 
         # 1 shot: 
         mainWindow.moduleSelector().selectModule('DICOM')
         ct_thorax_folder = os.path.join(extract_path, "dataset1_ThoraxAbdomenCT")
         
-        import DICOMLib
         from DICOMLib import DICOMUtils
         
         dicomDatabase = slicer.dicomDatabase
@@ -441,34 +536,26 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         self.delayDisplay('Importing DICOM files...')
         DICOMUtils.importDicom(ct_thorax_folder)
         
-        import time
-        time.sleep(2)
-        slicer.app.processEvents()
-        
         self.delayDisplay('Loading DICOM data...')
-        dicomFiles = slicer.util.getFilesInDirectory(ct_thorax_folder)
-        loadablesByPlugin, loadEnabled = DICOMLib.getLoadablesFromFileLists([dicomFiles])
-        loadedNodeIDs = DICOMLib.loadLoadables(loadablesByPlugin)
-        
-        max_wait_time = 30
-        start_time = time.time()
+        # Load the series just imported from the database instead of re-scanning the folder
+        ct_thorax_prefix = os.path.join(os.path.normpath(ct_thorax_folder), "")
+        ct_thorax_series = []
+        for patientUID in dicomDatabase.patients():
+            for studyUID in dicomDatabase.studiesForPatient(patientUID):
+                for seriesUID in dicomDatabase.seriesForStudy(studyUID):
+                    seriesFiles = dicomDatabase.filesForSeries(seriesUID)
+                    if seriesFiles and os.path.normpath(seriesFiles[0]).startswith(ct_thorax_prefix):
+                        ct_thorax_series.append(seriesUID)
+        loadedNodeIDs = DICOMUtils.loadSeriesByUID(ct_thorax_series)
+        
+        # Loading is synchronous, so pick the CT volume from the returned node IDs
         ct_node = None
-        
-        while ct_node is None and (time.time() - start_time) < max_wait_time:
-            slicer.app.processEvents()
-            time.sleep(0.5)
-            
-            try:
-                ct_node = slicer.util.getNode("6: CT_Thorax_Abdomen")
-                if ct_node:
+        for nodeID in loadedNodeIDs or []:
+            node = slicer.mrmlScene.GetNodeByID(nodeID)
+            if node and node.IsA('vtkMRMLScalarVolumeNode') and 'CT_Thorax_Abdomen' in node.GetName():
+                ct_node = node
+                if node.GetName() == "6: CT_Thorax_Abdomen":
                     break
-            except:
-                volumeNodes = slicer.util.getNodesByClass('vtkMRMLScalarVolumeNode')
-                for node in volumeNodes:
-                    nodeName = node.GetName()
-                    if 'CT_Thorax_Abdomen' in nodeName:
-                        ct_node = node
-                        break
         
         if ct_node is None:
             raise Exception("Failed to load DICOM data. Node '6: CT_Thorax_Abdomen' not found.")
@@ -487,7 +574,7 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         parameterNode.SetParameter("Model", modelId)
         
         # Set search box with translated keywords for visual feedback
-        searchBox = slicer.util.findChild(slicer.util.mainWindow(), "modelSearchBox")
+        searchBox = self._findWidget("modelSearchBox")
         searchKeywords = self.getModelSearchKeywords(modelId, logic)
         searchBox.setText(searchKeywords)
         
@@ -495,7 +582,7 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         self.delayDisplay('Screenshot #3: Whole Body Segmentation (TS1 - quick) model selected and ready to run')
 
         # 3 shot: Select volume input
-        nodeSelectorTc = slicer.util.findChild(slicer.util.mainWindow(), "inputNodeSelector0")
+        nodeSelectorTc = self._findWidget("inputNodeSelector0")
         nodeSelectorTc.setCurrentNode(ct_node)
 
         # TUTORIALMAKER SCREENSHOT
@@ -507,35 +594,9 @@ class Slicer4MinuteTest(ScriptedLoadableModuleTest):
         self.delayDisplay('Screenshot #4: Model running')
         self.delayDisplay('Waiting for the model to finish...')
         
-        import time
-        segment_found = False
-        max_wait_time = 300  # Maximum wait time in seconds (5 minutes)
-        start_time = time.time()
-        
-        while not segment_found:
-            # Process GUI events to prevent freezing
-            slicer.app.processEvents()
-            
-            # Check for timeout
-            if time.time() - start_time > max_wait_time:
-                break
-            
-            try:
-                segmentation_nodes = slicer.util.getNodesByClass('vtkMRMLSegmentationNode')
-                for seg_node in segmentation_nodes:
-                    if seg_node.GetSegmentation().GetNumberOfSegments() > 0:
-                        segment_names = [seg_node.GetSegmentation().GetNthSegment(i).GetName().lower() for i in range(seg_node.GetSegmentation().GetNumberOfSegments())]
-                        if "urinary bladder" in segment_names:
-                            segment_found = True
-                            break
-            except Exception as e:
-                print(f"Error checking segments: {e}")
-                pass
-            
-            # Small delay to prevent excessive CPU usage
-            time.sleep(1)
+        self._waitForSegment(self._WHOLEBODY_TARGETS)
 
-        show3DButton = slicer.util.findChild(slicer.util.mainWindow(), "segmentationShow3DButton")
+        show3DButton = self._findWidget("segmentationShow3DButton")
         show3DButton.toggle()
         
         threeDWidget = layoutManager.threeDWidget(0)